@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+import importlib
+
+kB = 1024
+
+# Capabilities -------------------------------------------------------------------------------------
+
+CAPABILITY_BITS = {
+    # Communication
+    "serial":         1 <<  0,
+    "usb_fifo":       1 <<  1,
+    "usb_acm":        1 <<  2,
+    "ethernet":       1 <<  3,
+    # Storage
+    "spiflash":       1 <<  4,
+    "spisdcard":      1 <<  5,
+    "sdcard":         1 <<  6,
+    "sata":           1 <<  7,
+    # GPIOs
+    "leds":           1 <<  8,
+    "rgb_led":        1 <<  9,
+    "switches":       1 << 10,
+    # Buses
+    "spi":            1 << 11,
+    "i2c":            1 << 12,
+    # Video
+    "framebuffer":    1 << 13,
+    # Monitoring
+    "xadc":           1 << 14,
+    # 7-Series specific
+    "mmcm":           1 << 15,
+    "icap_bitstream": 1 << 16,
+}
+
+# Board definition----------------------------------------------------------------------------------
+
+class Board:
+    # Class attributes, so that e.g. the capabilities can be read without instantiating the board.
+    soc_kwargs       = {"integrated_rom_size": 0x10000}
+    target           = None
+    soc_capabilities = set()
+    bitstream_ext    = ""
+
+    def __init__(self):
+        self.soc_capabilities = frozenset(self.soc_capabilities)
+        self.caps_mask        = 0
+        for capability in self.soc_capabilities:
+            self.caps_mask |= CAPABILITY_BITS[capability]
+
+    @property
+    def soc_cls(self):
+        # Only import the LiteX-Boards target when the board is actually used.
+        return importlib.import_module("litex_boards.targets." + self.target).BaseSoC
+
+    def load(self, filename):
+        prog = self.platform.create_programmer()
+        prog.load_bitstream(filename)
+
+    def flash(self):
+        raise NotImplementedError
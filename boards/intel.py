@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+from boards import Board
+
+#---------------------------------------------------------------------------------------------------
+# Intel Boards
+#---------------------------------------------------------------------------------------------------
+
+# De10Lite support ---------------------------------------------------------------------------------
+
+class De10Lite(Board):
+    target           = "de10lite"
+    soc_capabilities = {
+        # Communication
+        "serial",
+    }
+    bitstream_ext    = ".sof"
+
+# De10Nano support ---------------------------------------------------------------------------------
+
+class De10Nano(Board):
+    soc_kwargs = {"with_mister_sdram": True} # Add MiSTer SDRAM extension.
+    target           = "de10nano"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        # Storage
+        "spisdcard",
+        # GPIOs
+        "leds",
+        "switches",
+    }
+    bitstream_ext    = ".sof"
+
+# De0Nano support ----------------------------------------------------------------------------------
+
+class De0Nano(Board):
+    soc_kwargs = {
+        "integrated_rom_size": 0x8000, # Reduce integrated_rom_size.
+    }
+    target           = "de0nano"
+    soc_capabilities = {
+        # Communication
+        "serial",
+    }
+    bitstream_ext    = ".sof"
+
+# QMTECH EP4CE15 support ---------------------------------------------------------------------------
+
+class Qmtech_EP4CE15(Board):
+    soc_kwargs = {
+        "integrated_sram_size": 0x800,
+        "integrated_rom_size": 0x8000, # Reduce integrated_rom_size.
+    }
+    target           = "qmtech_ep4ce15"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        # "leds",
+    }
+    bitstream_ext    = ".sof"
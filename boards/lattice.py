@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+import os
+import subprocess
+import sys
+
+from boards import Board, kB
+
+#---------------------------------------------------------------------------------------------------
+# Lattice Boards
+#---------------------------------------------------------------------------------------------------
+
+# Versa ECP5 support -------------------------------------------------------------------------------
+
+class VersaECP5(Board):
+    SPIFLASH_PAGE_SIZE    = 256
+    SPIFLASH_SECTOR_SIZE  = 64*kB
+    SPIFLASH_DUMMY_CYCLES = 11
+    target           = "versa_ecp5"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        "ethernet",
+        # Storage
+        "spiflash",
+    }
+    bitstream_ext    = ".svf"
+
+# ULX3S support ------------------------------------------------------------------------------------
+
+class ULX3S(Board):
+    target           = "ulx3s"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        # Storage
+        "spisdcard",
+    }
+    bitstream_ext    = ".svf"
+
+# HADBadge support ---------------------------------------------------------------------------------
+
+class HADBadge(Board):
+    SPIFLASH_PAGE_SIZE    = 256
+    SPIFLASH_SECTOR_SIZE  = 64*kB
+    SPIFLASH_DUMMY_CYCLES = 8
+    target           = "hadbadge"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        # Storage
+        "spiflash",
+    }
+    bitstream_ext    = ".bit"
+
+    def load(self, filename):
+        os.system("dfu-util --alt 2 --download {} --reset".format(filename))
+
+# OrangeCrab support -------------------------------------------------------------------------------
+
+def init_valentyusb():
+    # Only clone ValentyUSB when not already present. FIXME: do proper install of ValentyUSB.
+    if not os.path.isdir("valentyusb"):
+        subprocess.run(["git", "clone", "https://github.com/litex-hub/valentyusb",
+            "-b", "hw_cdc_eptri"], check=True)
+    if "valentyusb" not in sys.path:
+        sys.path.append("valentyusb")
+
+class OrangeCrab(Board):
+    soc_kwargs = {
+        "sys_clk_freq": int(64e6),     # Increase sys_clk_freq to 64MHz (48MHz default).
+        "integrated_rom_size": 0xa000, # Reduce integrated_rom_size.
+    }
+    target           = "orangecrab"
+    soc_capabilities = {
+        # Communication
+        "usb_acm",
+        # Storage
+        "spisdcard",
+    }
+    bitstream_ext    = ".bit"
+
+    @property
+    def soc_cls(self):
+        init_valentyusb() # The orangecrab target imports ValentyUSB.
+        return Board.soc_cls.fget(self)
+
+# Cam Link 4K support ------------------------------------------------------------------------------
+
+class CamLink4K(Board):
+    target           = "camlink_4k"
+    soc_capabilities = {
+        # Communication
+        "serial",
+    }
+    bitstream_ext    = ".bit"
+
+    def load(self, filename):
+        os.system("camlink configure {}".format(filename))
+
+# TrellisBoard support -----------------------------------------------------------------------------
+
+class TrellisBoard(Board):
+    target           = "trellisboard"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        # Storage
+        "spisdcard",
+    }
+    bitstream_ext    = ".svf"
+
+# ECPIX5 support -----------------------------------------------------------------------------------
+
+class ECPIX5(Board):
+    target           = "ecpix5"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        "ethernet",
+        # Storage
+        "sdcard",
+    }
+    bitstream_ext    = ".svf"
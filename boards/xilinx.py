@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+
+from boards import Board, kB
+
+#---------------------------------------------------------------------------------------------------
+# Xilinx Boards
+#---------------------------------------------------------------------------------------------------
+
+# Acorn CLE 215+ support ---------------------------------------------------------------------------
+
+class AcornCLE215(Board):
+    target           = "acorn_cle_215"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        # Storage
+        "sata",
+    }
+    bitstream_ext    = ".bit"
+
+# Arty support -------------------------------------------------------------------------------------
+
+class Arty(Board):
+    SPIFLASH_PAGE_SIZE    = 256
+    SPIFLASH_SECTOR_SIZE  = 64*kB
+    SPIFLASH_DUMMY_CYCLES = 11
+    target           = "arty"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        "ethernet",
+        # Storage
+        "spiflash",
+        "spisdcard",
+        # GPIOs
+        "leds",
+        "rgb_led",
+        "switches",
+        # Buses
+        "spi",
+        "i2c",
+        # Monitoring
+        "xadc",
+        # 7-Series specific
+        "mmcm",
+        "icap_bitstream",
+    }
+    bitstream_ext    = ".bit"
+
+class ArtyA7(Arty):
+    SPIFLASH_DUMMY_CYCLES = 7
+
+class ArtyS7(Arty):
+    target           = "arty_s7"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        # Storage
+        "spiflash",
+        "spisdcard",
+        # GPIOs
+        "leds",
+        "rgb_led",
+        "switches",
+        # Buses
+        "spi",
+        "i2c",
+        # Monitoring
+        "xadc",
+        # 7-Series specific
+        "mmcm",
+        "icap_bitstream",
+    }
+    bitstream_ext    = ".bit"
+
+# NeTV2 support ------------------------------------------------------------------------------------
+
+class NeTV2(Board):
+    SPIFLASH_PAGE_SIZE    = 256
+    SPIFLASH_SECTOR_SIZE  = 64*kB
+    SPIFLASH_DUMMY_CYCLES = 11
+    target           = "netv2"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        "ethernet",
+        # Storage
+        "spiflash",
+        "spisdcard",
+        # GPIOs
+        "leds",
+        # Video
+        "framebuffer",
+        # Monitoring
+        "xadc",
+    }
+    bitstream_ext    = ".bit"
+
+# Genesys2 support ---------------------------------------------------------------------------------
+
+class Genesys2(Board):
+    target           = "genesys2"
+    soc_capabilities = {
+        # Communication
+        "usb_fifo",
+        "ethernet",
+        # Storage
+        "spisdcard",
+    }
+    bitstream_ext    = ".bit"
+
+# KC705 support ---------------------------------------------------------------------------------
+
+class KC705(Board):
+    soc_kwargs = {"uart_baudrate": 500e3} # 1Mbauds not supported by CP210x.
+    target           = "kc705"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        "ethernet",
+        # Storage
+        "spisdcard",
+        #"sata",
+        # GPIOs
+        "leds",
+        # Monitoring
+        "xadc",
+    }
+    bitstream_ext    = ".bit"
+
+# KCU105 support -----------------------------------------------------------------------------------
+
+class KCU105(Board):
+    soc_kwargs = {"uart_baudrate": 115.2e3} # FIXME: understand why not working with more.
+    target           = "kcu105"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        "ethernet",
+        # Storage
+        "spisdcard",
+    }
+    bitstream_ext    = ".bit"
+
+# ZCU104 support -----------------------------------------------------------------------------------
+
+class ZCU104(Board):
+    target           = "zcu104"
+    soc_capabilities = {
+        # Communication
+        "serial",
+    }
+    bitstream_ext    = ".bit"
+
+# Nexys4DDR support --------------------------------------------------------------------------------
+
+class Nexys4DDR(Board):
+    target           = "nexys4ddr"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        "ethernet",
+        # Storage
+        "spisdcard",
+    }
+    bitstream_ext    = ".bit"
+
+# NexysVideo support -------------------------------------------------------------------------------
+
+class NexysVideo(Board):
+    target           = "nexys_video"
+    soc_capabilities = {
+        # Communication
+        "usb_fifo",
+        # Storage
+        "spisdcard",
+        # Video
+        "framebuffer",
+    }
+    bitstream_ext    = ".bit"
+
+# MiniSpartan6 support -----------------------------------------------------------------------------
+
+class MiniSpartan6(Board):
+    soc_kwargs = {
+        "sdram_sys2x":  True, # Use HalfRate SDRAM PHY.
+    }
+    target           = "minispartan6"
+    soc_capabilities = {
+        # Communication
+        "usb_fifo",
+        # Storage
+        "spisdcard",
+    }
+    bitstream_ext    = ".bit"
+
+# Pipistrello support ------------------------------------------------------------------------------
+
+class Pipistrello(Board):
+    target           = "pipistrello"
+    soc_capabilities = {
+        # Communication
+        "serial",
+    }
+    bitstream_ext    = ".bit"
+
+# XCU1525 support ----------------------------------------------------------------------------------
+
+class XCU1525(Board):
+    target           = "xcu1525"
+    soc_capabilities = {
+        # Communication
+        "serial",
+        # Storage
+        "sata",
+    }
+    bitstream_ext    = ".bit"
@@ -1,559 +1,397 @@
 #!/usr/bin/env python3
 
-import sys
 import argparse
+import glob
+import hashlib
+import importlib
+import json
 import os
+import pickle
+import shutil
+import sys
+import threading
+import time
 
-from litex.soc.cores.cpu import VexRiscvSMP
-from litex.soc.integration.builder import Builder
-
-from soc_linux import SoCLinux, video_resolutions
-
-kB = 1024
-
-# Board definition----------------------------------------------------------------------------------
-
-class Board:
-    soc_kwargs = {"integrated_rom_size": 0x10000}
-    def __init__(self, soc_cls=None, soc_capabilities={}, bitstream_ext=""):
-        self.soc_cls          = soc_cls
-        self.soc_capabilities = soc_capabilities
-        self.bitstream_ext    = bitstream_ext
-
-    def load(self, filename):
-        prog = self.platform.create_programmer()
-        prog.load_bitstream(filename)
-
-    def flash(self):
-        raise NotImplementedError
-
-#---------------------------------------------------------------------------------------------------
-# Xilinx Boards
-#---------------------------------------------------------------------------------------------------
-
-# Acorn CLE 215+ support ---------------------------------------------------------------------------
-
-class AcornCLE215(Board):
-    def __init__(self):
-        from litex_boards.targets import acorn_cle_215
-        Board.__init__(self, acorn_cle_215.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            # Storage
-            "sata",
-        }, bitstream_ext=".bit")
-
-# Arty support -------------------------------------------------------------------------------------
-
-class Arty(Board):
-    SPIFLASH_PAGE_SIZE    = 256
-    SPIFLASH_SECTOR_SIZE  = 64*kB
-    SPIFLASH_DUMMY_CYCLES = 11
-    def __init__(self):
-        from litex_boards.targets import arty
-        Board.__init__(self, arty.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            "ethernet",
-            # Storage
-            "spiflash",
-            "spisdcard",
-            # GPIOs
-            "leds",
-            "rgb_led",
-            "switches",
-            # Buses
-            "spi",
-            "i2c",
-            # Monitoring
-            "xadc",
-            # 7-Series specific
-            "mmcm",
-            "icap_bitstream",
-        }, bitstream_ext=".bit")
-
-class ArtyA7(Arty):
-    SPIFLASH_DUMMY_CYCLES = 7
-
-class ArtyS7(Arty):
-    def __init__(self):
-        from litex_boards.targets import arty_s7
-        Board.__init__(self, arty_s7.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            # Storage
-            "spiflash",
-            "spisdcard",
-            # GPIOs
-            "leds",
-            "rgb_led",
-            "switches",
-            # Buses
-            "spi",
-            "i2c",
-            # Monitoring
-            "xadc",
-            # 7-Series specific
-            "mmcm",
-            "icap_bitstream",
-        }, bitstream_ext=".bit")
-
-# NeTV2 support ------------------------------------------------------------------------------------
-
-class NeTV2(Board):
-    SPIFLASH_PAGE_SIZE    = 256
-    SPIFLASH_SECTOR_SIZE  = 64*kB
-    SPIFLASH_DUMMY_CYCLES = 11
-    def __init__(self):
-        from litex_boards.targets import netv2
-        Board.__init__(self, netv2.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            "ethernet",
-            # Storage
-            "spiflash",
-            "spisdcard",
-            # GPIOs
-            "leds",
-            # Video
-            "framebuffer",
-            # Monitoring
-            "xadc",
-        }, bitstream_ext=".bit")
-
-# Genesys2 support ---------------------------------------------------------------------------------
-
-class Genesys2(Board):
-    def __init__(self):
-        from litex_boards.targets import genesys2
-        Board.__init__(self, genesys2.BaseSoC, soc_capabilities={
-            # Communication
-            "usb_fifo",
-            "ethernet",
-            # Storage
-            "spisdcard",
-        }, bitstream_ext=".bit")
-
-# KC705 support ---------------------------------------------------------------------------------
-
-class KC705(Board):
-    soc_kwargs = {"uart_baudrate": 500e3} # 1Mbauds not supported by CP210x.
-    def __init__(self):
-        from litex_boards.targets import kc705
-        Board.__init__(self, kc705.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            "ethernet",
-            # Storage
-            "spisdcard",
-            #"sata",
-            # GPIOs
-            "leds",
-            # Monitoring
-            "xadc",
-        }, bitstream_ext=".bit")
-
-# KCU105 support -----------------------------------------------------------------------------------
-
-class KCU105(Board):
-    soc_kwargs = {"uart_baudrate": 115.2e3} # FIXME: understand why not working with more.
-    def __init__(self):
-        from litex_boards.targets import kcu105
-        Board.__init__(self, kcu105.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            "ethernet",
-            # Storage
-            "spisdcard",
-        }, bitstream_ext=".bit")
-
-# ZCU104 support -----------------------------------------------------------------------------------
-
-class ZCU104(Board):
-    def __init__(self):
-        from litex_boards.targets import zcu104
-        Board.__init__(self, zcu104.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-        }, bitstream_ext=".bit")
-
-# Nexys4DDR support --------------------------------------------------------------------------------
-
-class Nexys4DDR(Board):
-    def __init__(self):
-        from litex_boards.targets import nexys4ddr
-        Board.__init__(self, nexys4ddr.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            "ethernet",
-            # Storage
-            "spisdcard",
-        }, bitstream_ext=".bit")
-
-# NexysVideo support -------------------------------------------------------------------------------
-
-class NexysVideo(Board):
-    def __init__(self):
-        from litex_boards.targets import nexys_video
-        Board.__init__(self, nexys_video.BaseSoC, soc_capabilities={
-            # Communication
-            "usb_fifo",
-            # Storage
-            "spisdcard",
-            # Video
-            "framebuffer",
-        }, bitstream_ext=".bit")
-
-# MiniSpartan6 support -----------------------------------------------------------------------------
-
-class MiniSpartan6(Board):
-    soc_kwargs = {
-        "sdram_sys2x":  True, # Use HalfRate SDRAM PHY.
-    }
-    def __init__(self):
-        from litex_boards.targets import minispartan6
-        Board.__init__(self, minispartan6.BaseSoC, soc_capabilities={
-            # Communication
-            "usb_fifo",
-            # Storage
-            "spisdcard",
-        }, bitstream_ext=".bit")
-
-# Pipistrello support ------------------------------------------------------------------------------
-
-class Pipistrello(Board):
-    def __init__(self):
-        from litex_boards.targets import pipistrello
-        Board.__init__(self, pipistrello.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-        }, bitstream_ext=".bit")
-
-# XCU1525 support ----------------------------------------------------------------------------------
-
-class XCU1525(Board):
-    def __init__(self):
-        from litex_boards.targets import xcu1525
-        Board.__init__(self, xcu1525.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            # Storage
-            "sata",
-        }, bitstream_ext=".bit")
-
-#---------------------------------------------------------------------------------------------------
-# Lattice Boards
-#---------------------------------------------------------------------------------------------------
-
-# Versa ECP5 support -------------------------------------------------------------------------------
-
-class VersaECP5(Board):
-    SPIFLASH_PAGE_SIZE    = 256
-    SPIFLASH_SECTOR_SIZE  = 64*kB
-    SPIFLASH_DUMMY_CYCLES = 11
-    def __init__(self):
-        from litex_boards.targets import versa_ecp5
-        Board.__init__(self, versa_ecp5.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            "ethernet",
-            # Storage
-            "spiflash",
-        }, bitstream_ext=".svf")
-
-# ULX3S support ------------------------------------------------------------------------------------
-
-class ULX3S(Board):
-    def __init__(self):
-        from litex_boards.targets import ulx3s
-        Board.__init__(self, ulx3s.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            # Storage
-            "spisdcard",
-        }, bitstream_ext=".svf")
-
-# HADBadge support ---------------------------------------------------------------------------------
-
-class HADBadge(Board):
-    SPIFLASH_PAGE_SIZE    = 256
-    SPIFLASH_SECTOR_SIZE  = 64*kB
-    SPIFLASH_DUMMY_CYCLES = 8
-    def __init__(self):
-        from litex_boards.targets import hadbadge
-        Board.__init__(self, hadbadge.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            # Storage
-            "spiflash",
-        }, bitstream_ext=".bit")
-
-    def load(self, filename):
-        os.system("dfu-util --alt 2 --download {} --reset".format(filename))
-
-# OrangeCrab support -------------------------------------------------------------------------------
-
-class OrangeCrab(Board):
-    soc_kwargs = {
-        "sys_clk_freq": int(64e6),     # Increase sys_clk_freq to 64MHz (48MHz default).
-        "integrated_rom_size": 0xa000, # Reduce integrated_rom_size.
-    }
-    def __init__(self):
-        from litex_boards.targets import orangecrab
-        os.system("git clone https://github.com/litex-hub/valentyusb -b hw_cdc_eptri")
-        sys.path.append("valentyusb") # FIXME: do proper install of ValentyUSB.
-        Board.__init__(self, orangecrab.BaseSoC, soc_capabilities={
-            # Communication
-            "usb_acm",
-            # Storage
-            "spisdcard",
-        }, bitstream_ext=".bit")
-
-# Cam Link 4K support ------------------------------------------------------------------------------
-
-class CamLink4K(Board):
-    def __init__(self):
-        from litex_boards.targets import camlink_4k
-        Board.__init__(self, camlink_4k.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-        }, bitstream_ext=".bit")
-
-    def load(self, filename):
-        os.system("camlink configure {}".format(filename))
-
-# TrellisBoard support -----------------------------------------------------------------------------
-
-class TrellisBoard(Board):
-    def __init__(self):
-        from litex_boards.targets import trellisboard
-        Board.__init__(self, trellisboard.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            # Storage
-            "spisdcard",
-        }, bitstream_ext=".svf")
-
-# ECPIX5 support -----------------------------------------------------------------------------------
-
-class ECPIX5(Board):
-    def __init__(self):
-        from litex_boards.targets import ecpix5
-        Board.__init__(self, ecpix5.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            "ethernet",
-            # Storage
-            "sdcard",
-        }, bitstream_ext=".svf")
-
-#---------------------------------------------------------------------------------------------------
-# Intel Boards
-#---------------------------------------------------------------------------------------------------
-
-# De10Lite support ---------------------------------------------------------------------------------
-
-class De10Lite(Board):
-    def __init__(self):
-        from litex_boards.targets import de10lite
-        Board.__init__(self, de10lite.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-        }, bitstream_ext=".sof")
-
-# De10Nano support ---------------------------------------------------------------------------------
-
-class De10Nano(Board):
-    soc_kwargs = {"with_mister_sdram": True} # Add MiSTer SDRAM extension.
-    def __init__(self):
-        from litex_boards.targets import de10nano
-        Board.__init__(self, de10nano.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            # Storage
-            "spisdcard",
-            # GPIOs
-            "leds",
-            "switches",
-        }, bitstream_ext=".sof")
-
-# De0Nano support ----------------------------------------------------------------------------------
-
-class De0Nano(Board):
-    soc_kwargs = {
-        "integrated_rom_size": 0x8000, # Reduce integrated_rom_size.
-    }
-    def __init__(self):
-        from litex_boards.targets import de0nano
-        Board.__init__(self, de0nano.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-        }, bitstream_ext=".sof")
-
-# QMTECH EP4CE15 support ---------------------------------------------------------------------------
-
-class Qmtech_EP4CE15(Board):
-    soc_kwargs = {
-        "integrated_sram_size": 0x800,
-        "integrated_rom_size": 0x8000, # Reduce integrated_rom_size.
-    }
-    def __init__(self):
-        from litex_boards.targets import qmtech_ep4ce15
-        Board.__init__(self, qmtech_ep4ce15.BaseSoC, soc_capabilities={
-            # Communication
-            "serial",
-            # "leds",
-        }, bitstream_ext=".sof")
+from boards import Board, CAPABILITY_BITS
 
 #---------------------------------------------------------------------------------------------------
 # Build
 #---------------------------------------------------------------------------------------------------
 
+# (module, class) registry; the board modules are only imported for the selected board(s).
 supported_boards = {
     # Xilinx
-    "acorn_cle_215": AcornCLE215,
-    "arty":          Arty,
-    "arty_a7":       ArtyA7,
-    "arty_s7":       ArtyS7,
-    "netv2":         NeTV2,
-    "genesys2":      Genesys2,
-    "kc705":         KC705,
-    "kcu105":        KCU105,
-    "zcu104":        ZCU104,
-    "nexys4ddr":     Nexys4DDR,
-    "nexys_video":   NexysVideo,
-    "minispartan6":  MiniSpartan6,
-    "pipistrello":   Pipistrello,
-    "xcu1525":       XCU1525,
+    "acorn_cle_215": ("boards.xilinx", "AcornCLE215"),
+    "arty":          ("boards.xilinx", "Arty"),
+    "arty_a7":       ("boards.xilinx", "ArtyA7"),
+    "arty_s7":       ("boards.xilinx", "ArtyS7"),
+    "netv2":         ("boards.xilinx", "NeTV2"),
+    "genesys2":      ("boards.xilinx", "Genesys2"),
+    "kc705":         ("boards.xilinx", "KC705"),
+    "kcu105":        ("boards.xilinx", "KCU105"),
+    "zcu104":        ("boards.xilinx", "ZCU104"),
+    "nexys4ddr":     ("boards.xilinx", "Nexys4DDR"),
+    "nexys_video":   ("boards.xilinx", "NexysVideo"),
+    "minispartan6":  ("boards.xilinx", "MiniSpartan6"),
+    "pipistrello":   ("boards.xilinx", "Pipistrello"),
+    "xcu1525":       ("boards.xilinx", "XCU1525"),
 
     # Lattice
-    "versa_ecp5":   VersaECP5,
-    "ulx3s":        ULX3S,
-    "hadbadge":     HADBadge,
-    "orangecrab":   OrangeCrab,
-    "camlink_4k":   CamLink4K,
-    "trellisboard": TrellisBoard,
-    "ecpix5":       ECPIX5,
+    "versa_ecp5":   ("boards.lattice", "VersaECP5"),
+    "ulx3s":        ("boards.lattice", "ULX3S"),
+    "hadbadge":     ("boards.lattice", "HADBadge"),
+    "orangecrab":   ("boards.lattice", "OrangeCrab"),
+    "camlink_4k":   ("boards.lattice", "CamLink4K"),
+    "trellisboard": ("boards.lattice", "TrellisBoard"),
+    "ecpix5":       ("boards.lattice", "ECPIX5"),
 
     # Altera/Intel
-    "de0nano":      De0Nano,
-    "de10lite":     De10Lite,
-    "de10nano":     De10Nano,
+    "de0nano":      ("boards.intel", "De0Nano"),
+    "de10lite":     ("boards.intel", "De10Lite"),
+    "de10nano":     ("boards.intel", "De10Nano"),
 
-    "qmtech_ep4ce15":      Qmtech_EP4CE15,
+    "qmtech_ep4ce15":      ("boards.intel", "Qmtech_EP4CE15"),
 }
 
+def get_board_class(board_name):
+    module_name, class_name = supported_boards[board_name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+def get_board(board_name):
+    return get_board_class(board_name)()
+
+def build_cache_key(board, soc_kwargs, args):
+    # Hash of everything the generated bitstream depends on: the SoC parameters, the board
+    # capabilities/constants and the effective value of every gateware-affecting argument. A
+    # fixed schema is used, falling back to the defaults of the options the two-phase parser did
+    # not register, so the key only changes when an effective value changes -- not when a
+    # different invocation happens to register a different option set.
+    from litex.soc.cores.cpu import VexRiscvSMP
+
+    defaults = argparse.ArgumentParser()
+    VexRiscvSMP.args_fill(defaults)
+    schema = {action.dest: action.default for action in defaults._actions
+        if action.option_strings != []}
+    schema.pop("help", None)
+    # Keep in sync with the defaults of the gateware-affecting options in main().
+    schema.update({
+        "local_ip":           "192.168.1.50",
+        "remote_ip":          "192.168.1.100",
+        "spi_data_width":     8,
+        "spi_clk_freq":       1e6,
+        "video":              "1920x1080_60Hz",
+        "compress_bitstream": True,
+    })
+
+    ident  = repr(sorted(soc_kwargs.items()))
+    ident += repr(sorted(board.soc_capabilities))
+    ident += repr([getattr(board, constant, None) for constant in
+        ("SPIFLASH_PAGE_SIZE", "SPIFLASH_SECTOR_SIZE", "SPIFLASH_DUMMY_CYCLES")])
+    ident += repr(sorted((k, getattr(args, k, default)) for k, default in schema.items()))
+    return hashlib.sha256(ident.encode()).hexdigest()
+
+def build_one(board_name, args):
+    # Heavy imports, deferred so that workers (and --help) only pay for them when building --------
+    from litex.soc.integration.builder import Builder
+    from soc_linux import SoCLinux, video_resolutions
+
+    # Read the CPU arguments here rather than in main(): args_read() sets class state, which
+    # worker processes only inherit when they are forked, not when they are spawned.
+    if args.build:
+        from litex.soc.cores.cpu import VexRiscvSMP
+        VexRiscvSMP.args_read(args)
+
+    board = get_board(board_name)
+
+    # SoC parameters ---------------------------------------------------------------------------
+    soc_kwargs = {**Board.soc_kwargs, **board.soc_kwargs} # New dict: never mutate the class attribute.
+    if args.device is not None:
+        soc_kwargs.update(device=args.device)
+    if args.variant is not None:
+        soc_kwargs.update(variant=args.variant)
+    if args.toolchain is not None:
+        soc_kwargs.update(toolchain=args.toolchain)
+    if board.caps_mask & CAPABILITY_BITS["usb_fifo"]:
+        soc_kwargs.update(uart_name="usb_fifo")
+    if board.caps_mask & CAPABILITY_BITS["usb_acm"]:
+        soc_kwargs.update(uart_name="usb_acm")
+    if board.caps_mask & CAPABILITY_BITS["ethernet"]:
+        soc_kwargs.update(with_ethernet=True)
+    if board.caps_mask & CAPABILITY_BITS["sata"]:
+        soc_kwargs.update(with_sata=True)
+
+    # SoC creation -----------------------------------------------------------------------------
+    soc = SoCLinux(board.soc_cls, **soc_kwargs)
+    board.platform = soc.platform
+
+    # SoC peripherals --------------------------------------------------------------------------
+    if board_name in ["arty", "arty_a7"]:
+        from litex_boards.platforms.arty import _sdcard_pmod_io
+        board.platform.add_extension(_sdcard_pmod_io)
+
+    def add_spi_flash():
+        soc.add_spi_flash(dummy_cycles=board.SPIFLASH_DUMMY_CYCLES)
+        soc.add_constant("SPIFLASH_PAGE_SIZE", board.SPIFLASH_PAGE_SIZE)
+        soc.add_constant("SPIFLASH_SECTOR_SIZE", board.SPIFLASH_SECTOR_SIZE)
+
+    def add_framebuffer():
+        assert args.video in video_resolutions.keys(), "Unsupported video resolution"
+        video_settings = video_resolutions[args.video]
+        soc.add_framebuffer(video_settings)
+
+    peripherals = (
+        (CAPABILITY_BITS["mmcm"],           lambda: soc.add_mmcm(2)),
+        (CAPABILITY_BITS["spiflash"],       add_spi_flash),
+        (CAPABILITY_BITS["spisdcard"],      soc.add_spi_sdcard),
+        (CAPABILITY_BITS["sdcard"],         soc.add_sdcard),
+        (CAPABILITY_BITS["ethernet"],       lambda: soc.configure_ethernet(local_ip=args.local_ip, remote_ip=args.remote_ip)),
+        #(CAPABILITY_BITS["leds"],           soc.add_leds),
+        (CAPABILITY_BITS["rgb_led"],        soc.add_rgb_led),
+        (CAPABILITY_BITS["switches"],       soc.add_switches),
+        (CAPABILITY_BITS["spi"],            lambda: soc.add_spi(args.spi_data_width, args.spi_clk_freq)),
+        (CAPABILITY_BITS["i2c"],            soc.add_i2c),
+        (CAPABILITY_BITS["xadc"],           soc.add_xadc),
+        (CAPABILITY_BITS["framebuffer"],    add_framebuffer),
+        (CAPABILITY_BITS["icap_bitstream"], soc.add_icap_bitstream),
+    )
+    for bit, add_peripheral in peripherals:
+        if board.caps_mask & bit:
+            add_peripheral()
+    soc.configure_boot()
+
+    # Bitstream compression --------------------------------------------------------------------
+    # A compressed bitstream is typically half the size, which directly shortens load/flash time.
+    if args.compress_bitstream:
+        toolchain = soc.platform.toolchain
+        if hasattr(toolchain, "bitstream_commands"): # Vivado
+            toolchain.bitstream_commands.append(
+                "set_property BITSTREAM.GENERAL.COMPRESS TRUE [current_design]")
+        elif hasattr(toolchain, "bitgen_opt"): # ISE
+            toolchain.bitgen_opt += " -g Compress"
+
+    # Build ------------------------------------------------------------------------------------
+    build_dir = os.path.join("build", board_name)
+    csr_json  = os.path.join(build_dir, "csr.json")
+    builder   = Builder(soc, csr_json=csr_json, bios_options=["TERM_MINI"])
+
+    # Skip the toolchain run when nothing the bitstream depends on has changed since last build.
+    cache_key  = build_cache_key(board, soc_kwargs, args)
+    key_file   = os.path.join(build_dir, ".cache_key")
+    key_match  = os.path.exists(key_file) and open(key_file).read().strip() == cache_key
+    bitstreams = glob.glob(os.path.join(builder.gateware_dir, "*" + board.bitstream_ext))
+    # --doc needs a finalized SoC, which only builder.build() provides: never take the fast path.
+    cached     = bitstreams != [] and key_match and not args.doc
+
+    bitstream = None
+    if cached:
+        bitstream = bitstreams[0]
+    else:
+        # The CSR layout only depends on the build inputs: when unchanged, reuse the cached
+        # csr.json for DTS-only runs and skip the SoC finalization walk entirely.
+        csr_cached = os.path.join(build_dir, "cache", cache_key, "csr.json")
+        dts_only   = not (args.build or args.load or args.doc)
+        if dts_only and key_match and os.path.exists(csr_cached):
+            # Always restore: an interrupted run may have left a csr.json from another key on
+            # disk, and only the cached copy is known to match the key.
+            shutil.copyfile(csr_cached, csr_json)
+
+            # DTS ------------------------------------------------------------------------------
+            soc.generate_dts(board_name)
+            soc.compile_dts(board_name)
+        else:
+            # The DTS only depends on csr.json, which the builder exports before calling the
+            # vendor toolchain: generate/compile it in a background thread so that its cost is
+            # hidden under the (much longer) toolchain run.
+            if os.path.exists(csr_json):
+                os.remove(csr_json)
+            build_done = threading.Event()
+
+            def make_dts():
+                # Wait until the builder's csr.json export parses: the export is not atomic, so
+                # only a successful json.load proves the file is complete.
+                while True:
+                    done = build_done.is_set()
+                    try:
+                        with open(csr_json) as f:
+                            json.load(f)
+                        break
+                    except (OSError, json.JSONDecodeError):
+                        if done:
+                            break # builder.build() is over: let generate_dts report the error.
+                        time.sleep(0.1)
+                soc.generate_dts(board_name)
+                soc.compile_dts(board_name)
+
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                dts_future = executor.submit(make_dts)
+                try:
+                    builder.build(run=args.build)
+                finally:
+                    build_done.set()
+                dts_future.result()
+
+            bitstream = os.path.join(builder.gateware_dir, soc.build_name + board.bitstream_ext)
+            os.makedirs(os.path.dirname(csr_cached), exist_ok=True)
+            shutil.copyfile(csr_json, csr_cached)
+            with open(key_file, "w") as f:
+                f.write(cache_key)
+
+    # Load FPGA bitstream ----------------------------------------------------------------------
+    if args.load:
+        board.load(filename=bitstream)
+
+    # Generate SoC documentation ---------------------------------------------------------------
+    if args.doc:
+        soc.generate_doc(board_name)
+
+# Parser cache -------------------------------------------------------------------------------------
+# Building the full parser (dozens of add_argument calls, more with the CPU options) costs tens of
+# ms per invocation; warm runs replay sys.argv against a pickled action table instead and fall back
+# to argparse on any mismatch.
+
+PARSER_CACHE = ".make_parser.cache"
+
+def parser_cache_key(pre_args):
+    return (os.path.getmtime(__file__), pre_args.board, pre_args.build)
+
+def save_parser_cache(parser, pre_args):
+    spec = []
+    for action in parser._actions:
+        if action.option_strings == [] or action.dest == "help":
+            continue
+        is_flag = isinstance(action, (argparse._StoreTrueAction, argparse._StoreFalseAction))
+        spec.append((tuple(action.option_strings), action.dest, is_flag, action.const,
+            action.type, action.default, action.required))
+    try:
+        with open(PARSER_CACHE, "wb") as f:
+            pickle.dump((parser_cache_key(pre_args), spec), f)
+    except (OSError, pickle.PicklingError, TypeError):
+        pass # Never fail an otherwise-valid run over the cache.
+
+def parse_args_cached(pre_args):
+    # Returns a Namespace on cache hit, None to request the regular argparse path.
+    if {"-h", "--help"}.intersection(sys.argv):
+        return None
+    try:
+        with open(PARSER_CACHE, "rb") as f:
+            key, spec = pickle.load(f)
+    except (OSError, EOFError, pickle.PickleError, AttributeError):
+        return None
+    if key != parser_cache_key(pre_args):
+        return None
+    options = {}
+    for strings, dest, is_flag, const, type_, default, required in spec:
+        for option_string in strings:
+            options[option_string] = (dest, is_flag, const, type_)
+    args = argparse.Namespace(**{entry[1]: entry[5] for entry in spec})
+    seen = set()
+    argv = sys.argv[1:]
+    i = 0
+    while i < len(argv):
+        token, _, value = argv[i].partition("=")
+        if token not in options:
+            return None # Unknown (or abbreviated) option: fall back to argparse.
+        dest, is_flag, const, type_ = options[token]
+        if is_flag:
+            if value != "":
+                return None
+            setattr(args, dest, const)
+        else:
+            if value == "":
+                i += 1
+                if i == len(argv):
+                    return None
+                value = argv[i]
+                # Like argparse, never consume an option-looking token (anything starting with
+                # "-" that is not a plain negative number) as a value.
+                if value.startswith("-"):
+                    try:
+                        float(value)
+                    except ValueError:
+                        return None
+            try:
+                setattr(args, dest, value if type_ is None else type_(value))
+            except ValueError:
+                return None
+        seen.add(dest)
+        i += 1
+    for strings, dest, is_flag, const, type_, default, required in spec:
+        if required and dest not in seen:
+            return None
+    return args
+
 def main():
     description = "Linux on LiteX-VexRiscv\n\n"
     description += "Available boards:\n"
     for name in supported_boards.keys():
         description += "- " + name + "\n"
-    parser = argparse.ArgumentParser(description=description, formatter_class=argparse.RawTextHelpFormatter)
-    parser.add_argument("--board",          required=True,            help="FPGA board")
-    parser.add_argument("--device",         default=None,             help="FPGA device")
-    parser.add_argument("--variant",        default=None,             help="FPGA board variant")
-    parser.add_argument("--toolchain",      default=None,             help="Toolchain use to build")
-    parser.add_argument("--build",          action="store_true",      help="Build bitstream")
-    parser.add_argument("--load",           action="store_true",      help="Load bitstream (to SRAM)")
-    parser.add_argument("--flash",          action="store_true",      help="Flash bitstream/images (to SPI Flash)")
-    parser.add_argument("--doc",            action="store_true",      help="Build documentation")
-    parser.add_argument("--local-ip",       default="192.168.1.50",   help="Local IP address")
-    parser.add_argument("--remote-ip",      default="192.168.1.100",  help="Remote IP address of TFTP server")
-    parser.add_argument("--spi-data-width", type=int, default=8,      help="SPI data width (maximum transfered bits per xfer)")
-    parser.add_argument("--spi-clk-freq",   type=int, default=1e6,    help="SPI clock frequency")
-    parser.add_argument("--video",          default="1920x1080_60Hz", help="Video configuration")
-    VexRiscvSMP.args_fill(parser)
-    args = parser.parse_args()
-
-    VexRiscvSMP.args_read(args)
+
+    # First parsing phase: resolve the board and the requested operations, so that the full parser
+    # only registers the options that apply (and only imports VexRiscvSMP when building).
+    pre_parser = argparse.ArgumentParser(add_help=False)
+    pre_parser.add_argument("--board", default=None)
+    pre_parser.add_argument("--build", action="store_true")
+    pre_args, _ = pre_parser.parse_known_args()
 
     # Board(s) selection ---------------------------------------------------------------------------
-    if args.board == "all":
+    board_names  = []
+    capabilities = None # None: board(s) not resolved yet, all options are registered.
+    if pre_args.board is not None and pre_args.board != "all":
+        board_name = pre_args.board.lower().replace(" ", "_")
+        if board_name in supported_boards:
+            board_names  = [board_name]
+            capabilities = get_board_class(board_name).soc_capabilities
+    if pre_args.board == "all":
         board_names = list(supported_boards.keys())
+
+    # Second parsing phase: full parser (skipped on parser-cache hit) -----------------------------
+    args = parse_args_cached(pre_args)
+    if args is None:
+        parser = argparse.ArgumentParser(description=description, formatter_class=argparse.RawTextHelpFormatter)
+        parser.add_argument("--board",          required=True,            help="FPGA board")
+        parser.add_argument("--device",         default=None,             help="FPGA device")
+        parser.add_argument("--variant",        default=None,             help="FPGA board variant")
+        parser.add_argument("--toolchain",      default=None,             help="Toolchain use to build")
+        parser.add_argument("--build",          action="store_true",      help="Build bitstream")
+        parser.add_argument("--load",           action="store_true",      help="Load bitstream (to SRAM)")
+        parser.add_argument("--flash",          action="store_true",      help="Flash bitstream/images (to SPI Flash)")
+        parser.add_argument("--doc",            action="store_true",      help="Build documentation")
+        parser.add_argument("--local-ip",       default="192.168.1.50",   help="Local IP address")
+        parser.add_argument("--remote-ip",      default="192.168.1.100",  help="Remote IP address of TFTP server")
+        if capabilities is None or "spi" in capabilities:
+            parser.add_argument("--spi-data-width", type=int, default=8,      help="SPI data width (maximum transfered bits per xfer)")
+            parser.add_argument("--spi-clk-freq",   type=int, default=1e6,    help="SPI clock frequency")
+        if capabilities is None or "framebuffer" in capabilities:
+            parser.add_argument("--video",          default="1920x1080_60Hz", help="Video configuration")
+        parser.add_argument("--jobs",           type=int, default=None,   help="Number of parallel builds with --board all (default: CPU count)")
+        parser.add_argument("--no-compress-bitstream", dest="compress_bitstream", action="store_false", help="Disable bitstream compression")
+        if pre_args.build:
+            from litex.soc.cores.cpu import VexRiscvSMP
+            VexRiscvSMP.args_fill(parser)
+        args = parser.parse_args()
+        if board_names == []:
+            parser.error("unknown board: {}".format(args.board))
+        save_parser_cache(parser, pre_args)
+
+    # Board(s) build ------------------------------------------------------------------------------
+    if len(board_names) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        jobs = args.jobs if args.jobs is not None else min(len(board_names), os.cpu_count())
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for _ in executor.map(build_one, board_names, [args]*len(board_names)):
+                pass
     else:
-        args.board = args.board.lower()
-        args.board = args.board.replace(" ", "_")
-        board_names = [args.board]
-
-    # Board(s) iteration ---------------------------------------------------------------------------
-    for board_name in board_names:
-        board = supported_boards[board_name]()
-
-        # SoC parameters ---------------------------------------------------------------------------
-        soc_kwargs = Board.soc_kwargs
-        soc_kwargs.update(board.soc_kwargs)
-        if args.device is not None:
-            soc_kwargs.update(device=args.device)
-        if args.variant is not None:
-            soc_kwargs.update(variant=args.variant)
-        if args.toolchain is not None:
-            soc_kwargs.update(toolchain=args.toolchain)
-        if "usb_fifo" in board.soc_capabilities:
-            soc_kwargs.update(uart_name="usb_fifo")
-        if "usb_acm" in board.soc_capabilities:
-            soc_kwargs.update(uart_name="usb_acm")
-        if "ethernet" in board.soc_capabilities:
-            soc_kwargs.update(with_ethernet=True)
-        if "sata" in board.soc_capabilities:
-            soc_kwargs.update(with_sata=True)
-
-        # SoC creation -----------------------------------------------------------------------------
-        soc = SoCLinux(board.soc_cls, **soc_kwargs)
-        board.platform = soc.platform
-
-        # SoC peripherals --------------------------------------------------------------------------
-        if board_name in ["arty", "arty_a7"]:
-            from litex_boards.platforms.arty import _sdcard_pmod_io
-            board.platform.add_extension(_sdcard_pmod_io)
-
-        if "mmcm" in board.soc_capabilities:
-            soc.add_mmcm(2)
-        if "spiflash" in board.soc_capabilities:
-            soc.add_spi_flash(dummy_cycles=board.SPIFLASH_DUMMY_CYCLES)
-            soc.add_constant("SPIFLASH_PAGE_SIZE", board.SPIFLASH_PAGE_SIZE)
-            soc.add_constant("SPIFLASH_SECTOR_SIZE", board.SPIFLASH_SECTOR_SIZE)
-        if "spisdcard" in board.soc_capabilities:
-            soc.add_spi_sdcard()
-        if "sdcard" in board.soc_capabilities:
-            soc.add_sdcard()
-        if "ethernet" in board.soc_capabilities:
-            soc.configure_ethernet(local_ip=args.local_ip, remote_ip=args.remote_ip)
-        #if "leds" in board.soc_capabilities:
-        #    soc.add_leds()
-        if "rgb_led" in board.soc_capabilities:
-            soc.add_rgb_led()
-        if "switches" in board.soc_capabilities:
-            soc.add_switches()
-        if "spi" in board.soc_capabilities:
-            soc.add_spi(args.spi_data_width, args.spi_clk_freq)
-        if "i2c" in board.soc_capabilities:
-            soc.add_i2c()
-        if "xadc" in board.soc_capabilities:
-            soc.add_xadc()
-        if "framebuffer" in board.soc_capabilities:
-            assert args.video in video_resolutions.keys(), "Unsupported video resolution"
-            video_settings = video_resolutions[args.video]
-            soc.add_framebuffer(video_settings)
-        if "icap_bitstream" in board.soc_capabilities:
-            soc.add_icap_bitstream()
-        soc.configure_boot()
-
-        # Build ------------------------------------------------------------------------------------
-        build_dir = os.path.join("build", board_name)
-        builder   = Builder(soc, csr_json=os.path.join(build_dir, "csr.json"), bios_options=["TERM_MINI"])
-        builder.build(run=args.build)
-
-        # DTS --------------------------------------------------------------------------------------
-        soc.generate_dts(board_name)
-        soc.compile_dts(board_name)
-
-        # Load FPGA bitstream ----------------------------------------------------------------------
-        if args.load:
-            board.load(filename=os.path.join(builder.gateware_dir, soc.build_name + board.bitstream_ext))
-
-        # Generate SoC documentation ---------------------------------------------------------------
-        if args.doc:
-            soc.generate_doc(board_name)
+        build_one(board_names[0], args)
+
+    # DTB installation -----------------------------------------------------------------------------
+    # Only install the DTB into images/ for single-board runs: with --board all each board keeps
+    # its own copy under build/<board>/.
+    if len(board_names) == 1:
+        dtb = os.path.join("build", board_names[0], "rv32.dtb")
+        if os.path.exists(dtb):
+            shutil.copyfile(dtb, os.path.join("images", "rv32.dtb"))
+
 
 if __name__ == "__main__":
     main()
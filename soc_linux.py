@@ -262,8 +262,10 @@ def SoCLinux(soc_cls, **kwargs):
 
         # DTS compilation --------------------------------------------------------------------------
         def compile_dts(self, board_name):
+            # Compile to a per-board path: with --board all, boards build concurrently and a
+            # shared output would be overwritten by every one of them.
             dts = os.path.join("build", board_name, "{}.dts".format(board_name))
-            dtb = os.path.join("images", "rv32.dtb")
+            dtb = os.path.join("build", board_name, "rv32.dtb")
             subprocess.check_call(
                 "dtc -O dtb -o {} {}".format(dtb, dts), shell=True)
 